@@ -0,0 +1,59 @@
+from git.refs.reference import Reference
+from git.repo import Repo
+
+_CHECKPOINT_REF_PREFIX = "refs/aserehe/checked/"
+
+
+def _checkpoint_ref_path(repo: Repo) -> str:
+    if repo.head.is_detached:
+        raise ValueError(
+            "Cannot use a checkpoint with a detached HEAD. Please check out a branch."
+        )
+    return _CHECKPOINT_REF_PREFIX + repo.active_branch.name
+
+
+def get_unchecked_rev_range(repo: Repo) -> str | None:
+    """Return the revision range of commits not covered by the branch checkpoint.
+
+    Returns None (i.e. check the whole history) if there is no checkpoint or if
+    the checkpoint is no longer an ancestor of HEAD, e.g. after a force-push.
+    """
+    checkpoint_ref = Reference(repo, _checkpoint_ref_path(repo))
+    if not checkpoint_ref.is_valid():
+        return None
+    checkpoint = checkpoint_ref.commit
+    if not repo.is_ancestor(checkpoint, repo.head.commit):
+        return None
+    return f"{checkpoint.hexsha}..HEAD"
+
+
+def prune_checkpoints(repo: Repo) -> list[str]:
+    """Delete checkpoints of branches that no longer exist.
+
+    Returns the deleted checkpoint references.
+    """
+    branch_names = {head.name for head in repo.heads}
+    checkpoint_refs = repo.git.for_each_ref(
+        "--format=%(refname)", _CHECKPOINT_REF_PREFIX
+    ).splitlines()
+    stale_refs = [
+        ref
+        for ref in checkpoint_refs
+        if ref.removeprefix(_CHECKPOINT_REF_PREFIX) not in branch_names
+    ]
+    for ref in stale_refs:
+        repo.git.update_ref("-d", ref)
+    return stale_refs
+
+
+def update_checkpoint(repo: Repo) -> None:
+    """Record HEAD as the last fully checked commit of the current branch.
+
+    Checkpoints of deleted branches are pruned first as they may conflict with
+    the checkpoint of the current branch (e.g. a checkpoint of a deleted branch
+    ``feature`` blocks a checkpoint of ``feature/x``).
+    """
+    prune_checkpoints(repo)
+    Reference.create(
+        repo, _checkpoint_ref_path(repo), repo.head.commit.hexsha, force=True
+    )
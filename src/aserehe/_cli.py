@@ -5,8 +5,16 @@ from git.repo import Repo
 from gitdb.exc import BadName, BadObject  # type: ignore[import-untyped]
 from typing_extensions import Annotated
 
+from aserehe._checkpoint import get_unchecked_rev_range, update_checkpoint
 from aserehe._commit import ConventionalCommit
-from aserehe._version import get_current_version, get_next_version
+from aserehe._notes import NotesFormat, format_notes
+from aserehe._version import (
+    create_snapshot,
+    get_current_version,
+    get_next_version,
+    get_next_version_with_commits,
+    load_snapshot,
+)
 
 app = typer.Typer()
 
@@ -44,6 +52,16 @@ def check(
             " Both START and END must exist (e.g. HEAD~5..HEAD)"
         ),
     ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help=(
+            "Only check commits since the last successfully checked HEAD of the"
+            " current branch (stored in refs/aserehe/checked/<branch>)."
+            " Falls back to checking all commits if the checkpoint is missing"
+            " or is no longer an ancestor of HEAD."
+        ),
+    ),
 ) -> None:
     if from_stdin:
         if rev_range is not None:
@@ -53,13 +71,28 @@ def check(
                 err=True,
             )
             raise typer.Exit(code=1)
+        if incremental:
+            typer.echo("Cannot use --incremental with --from-stdin.", err=True)
+            raise typer.Exit(code=1)
         stdin = typer.get_text_stream("stdin")
         ConventionalCommit.from_message(stdin.read())
     else:
         repo = Repo(_CURRENT_DIR)
-        _validate_rev_range(repo=repo, rev_range=rev_range)
+        if incremental:
+            if rev_range is not None:
+                typer.echo("Cannot use --rev-range with --incremental.", err=True)
+                raise typer.Exit(code=1)
+            try:
+                rev_range = get_unchecked_rev_range(repo)
+            except ValueError as e:
+                typer.echo(str(e), err=True)
+                raise typer.Exit(code=1) from e
+        else:
+            _validate_rev_range(repo=repo, rev_range=rev_range)
         for commit in repo.iter_commits(rev_range):
             ConventionalCommit.from_git_commit(commit)
+        if incremental:
+            update_checkpoint(repo)
 
 
 @app.command()
@@ -85,6 +118,25 @@ def version(
             " Current version is always inferred from all commits."
         ),
     ),
+    snapshot_path: Path | None = typer.Option(
+        None,
+        "--snapshot",
+        exists=True,
+        dir_okay=False,
+        help=(
+            "Tag snapshot created by the snapshot command in a full clone."
+            " Allows inferring versions in a shallow clone that contains"
+            " the snapshot head."
+        ),
+    ),
+    notes: NotesFormat | None = typer.Option(
+        None,
+        "--notes",
+        help=(
+            "Print release notes with the next version, grouped by commit type,"
+            " in the given format instead of the next version only."
+        ),
+    ),
 ) -> None:
     """
     Print the current or next version. A current version is printed unless --next option
@@ -97,6 +149,12 @@ def version(
     tagged with the current version.
     E.g. if the current version is 1.0.0 and there is a descendant conventional commit
     with a breaking change, the next version will be 2.0.0.
+
+    In a shallow clone, pass a snapshot created by the snapshot command using
+    the --snapshot option.
+
+    With --notes, release notes are printed together with the next version, both
+    inferred from a single walk over the commits since the current version.
     """
     if path is not None and not next:
         typer.echo(
@@ -104,10 +162,59 @@ def version(
             err=True,
         )
         raise typer.Exit(code=1)
+    if notes is not None and not next:
+        typer.echo(
+            "Cannot use --notes without --next option. See --help for more"
+            " information.",
+            err=True,
+        )
+        raise typer.Exit(code=1)
     repo = Repo(_CURRENT_DIR)
-    version_to_print = None
-    if next:
-        version_to_print = get_next_version(repo, tag_prefix, path)
-    else:
-        version_to_print = get_current_version(repo, tag_prefix)
+    snapshot = None
+    if snapshot_path is not None:
+        try:
+            snapshot = load_snapshot(repo, snapshot_path.read_text(), tag_prefix)
+        except ValueError as e:
+            typer.echo(str(e), err=True)
+            raise typer.Exit(code=1) from e
+    try:
+        if notes is not None:
+            next_version, commits = get_next_version_with_commits(
+                repo, tag_prefix, path, snapshot
+            )
+            typer.echo(format_notes(next_version, commits, notes))
+            return
+        version_to_print = None
+        if next:
+            version_to_print = get_next_version(repo, tag_prefix, path, snapshot)
+        else:
+            version_to_print = get_current_version(repo, tag_prefix, snapshot)
+    except ValueError as e:
+        # e.g. a --path not supported with --snapshot
+        typer.echo(str(e), err=True)
+        raise typer.Exit(code=1) from e
     typer.echo(version_to_print)
+
+
+@app.command()
+def snapshot(
+    tag_prefix: str = typer.Option(
+        "v",
+        "--tag-prefix",
+        help="Prefix before the version in the tag name.",
+    ),
+) -> None:
+    """
+    Print a JSON snapshot of the version tags that are ancestors of HEAD together
+    with the commits since the highest of them.
+
+    Create the snapshot in a full clone and pass it to the version command
+    using the --snapshot option in a shallow clone containing the current HEAD.
+    """
+    repo = Repo(_CURRENT_DIR)
+    try:
+        tag_snapshot = create_snapshot(repo, tag_prefix)
+    except ValueError as e:
+        typer.echo(str(e), err=True)
+        raise typer.Exit(code=1) from e
+    typer.echo(tag_snapshot.to_json())
@@ -24,6 +24,8 @@ class InvalidCommitTypeError(InvalidCommitMessageError):
 class ConventionalCommit:
     type: str
     breaking: bool
+    scope: str | None
+    description: str
 
     _TYPES = frozenset(
         {
@@ -38,7 +40,7 @@ class ConventionalCommit:
         }
     )
     _SUMMARY_REGEX = re.compile(
-        r"^(?P<type>\w+)(\((?P<scope>.*)\))?(?P<breaking>!)?: (?P<description>.+)$"
+        r"^(?P<type>\w+)(\((?P<scope>[^()]*)\))?(?P<breaking>!)?: (?P<description>.+)$"
     )
 
     @classmethod
@@ -51,7 +53,12 @@ class ConventionalCommit:
         if (commit_type := match.group("type")) not in cls._TYPES:
             raise InvalidCommitTypeError(f"Invalid commit type: {commit_type}")
 
-        return cls(type=commit_type, breaking=bool(match.group("breaking")))
+        return cls(
+            type=commit_type,
+            breaking=bool(match.group("breaking")),
+            scope=match.group("scope") or None,
+            description=match.group("description"),
+        )
 
     @classmethod
     def from_message(cls, message: str) -> Self:
@@ -79,6 +86,8 @@ class ConventionalCommit:
         return cls(
             type=summary_conv_commit.type,
             breaking=summary_conv_commit.breaking | breaking_changes,
+            scope=summary_conv_commit.scope,
+            description=summary_conv_commit.description,
         )
 
     @classmethod
@@ -0,0 +1,56 @@
+import json
+from dataclasses import asdict
+from enum import Enum
+
+from semantic_version import Version  # type: ignore[import-untyped]
+
+from aserehe._commit import ConventionalCommit
+
+_SECTION_TITLES = {
+    "feat": "Features",
+    "fix": "Bug Fixes",
+    "refactor": "Refactoring",
+    "docs": "Documentation",
+    "style": "Style",
+    "test": "Tests",
+    "ci": "CI",
+    "chore": "Chores",
+}
+
+
+class NotesFormat(str, Enum):
+    MARKDOWN = "markdown"
+    JSON = "json"
+
+
+def format_notes(
+    version: Version, commits: list[ConventionalCommit], notes_format: NotesFormat
+) -> str:
+    if notes_format == NotesFormat.JSON:
+        return json.dumps(
+            {"version": str(version), "commits": [asdict(c) for c in commits]},
+            indent=2,
+        )
+    return _format_markdown(version, commits)
+
+
+def _format_markdown(version: Version, commits: list[ConventionalCommit]) -> str:
+    sections: dict[str, list[ConventionalCommit]] = {"Breaking Changes": []}
+    sections.update({title: [] for title in _SECTION_TITLES.values()})
+    for commit in commits:
+        title = "Breaking Changes" if commit.breaking else _SECTION_TITLES[commit.type]
+        sections[title].append(commit)
+
+    lines = [f"## {version}"]
+    for title, section_commits in sections.items():
+        if not section_commits:
+            continue
+        lines += ["", f"### {title}", ""]
+        lines += [_format_markdown_item(commit) for commit in section_commits]
+    return "\n".join(lines)
+
+
+def _format_markdown_item(commit: ConventionalCommit) -> str:
+    if commit.scope:
+        return f"- **{commit.scope}:** {commit.description}"
+    return f"- {commit.description}"
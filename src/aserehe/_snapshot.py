@@ -0,0 +1,101 @@
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Self
+
+from git.repo import Repo
+
+_RECORD_SEPARATOR = "\x1e"
+_FIELD_SEPARATOR = "\x1f"
+_PATHSPEC_SPECIAL_CHARS = frozenset("*?[")
+
+
+@dataclass
+class SnapshotCommit:
+    hexsha: str
+    message: str
+    paths: list[str]
+
+    def modifies(self, path: str | None) -> bool:
+        """Return whether the commit modifies the file or directory path.
+
+        Paths are recorded as reported by ``git log --name-only``, so merge
+        commits have no paths and, as in ``git log -- <path>``, are not
+        considered to modify any path.
+        """
+        if not path or path == ".":
+            return True
+        path = path.rstrip("/")
+        return any(p == path or p.startswith(f"{path}/") for p in self.paths)
+
+
+@dataclass
+class TagSnapshot:
+    """Version tags reachable from ``head`` exported from a full clone.
+
+    ``pending_commits`` are the commits between the highest version tag and
+    ``head`` (or all ancestors of ``head`` if there is no version tag), so that
+    a shallow clone containing ``head`` can infer the next version without
+    fetching the tagged commits.
+    """
+
+    head: str
+    tag_prefix: str
+    tags: dict[str, str]
+    pending_commits: list[SnapshotCommit] = field(default_factory=list)
+
+    @classmethod
+    def from_json(cls, data: str) -> Self:
+        try:
+            loaded = json.loads(data)
+            return cls(
+                head=loaded["head"],
+                tag_prefix=loaded["tag_prefix"],
+                tags=loaded["tags"],
+                pending_commits=[
+                    SnapshotCommit(**commit) for commit in loaded["pending_commits"]
+                ],
+            )
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            raise ValueError(f"Invalid tag snapshot: {e!r}") from e
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), indent=2)
+
+    def pending_commits_modifying(self, path: str | None) -> list[SnapshotCommit]:
+        check_snapshot_path(path)
+        return [commit for commit in self.pending_commits if commit.modifies(path)]
+
+
+def check_snapshot_path(path: str | None) -> None:
+    """Raise ValueError for pathspecs that cannot be matched against a snapshot.
+
+    Only plain file and directory paths are supported, not glob patterns or
+    magic pathspecs (e.g. ``:(exclude)``).
+    """
+    if path and (path.startswith(":") or _PATHSPEC_SPECIAL_CHARS & set(path)):
+        raise ValueError(
+            f"Only plain file or directory paths are supported with a tag snapshot,"
+            f" got: {path}"
+        )
+
+
+def read_pending_commits(repo: Repo, rev_range: str) -> list[SnapshotCommit]:
+    """Read messages and changed paths of the commits in rev_range in one pass."""
+    output = repo.git(c=["core.quotePath=false", "diff.renames=false"]).log(
+        rev_range,
+        "--name-only",
+        # a rename is reported with both paths, as in git log -- <path>
+        "--no-renames",
+        f"--format={_RECORD_SEPARATOR}%H{_FIELD_SEPARATOR}%B{_FIELD_SEPARATOR}",
+    )
+    pending_commits = []
+    for record in output.split(_RECORD_SEPARATOR)[1:]:
+        hexsha, message, paths = record.split(_FIELD_SEPARATOR)
+        pending_commits.append(
+            SnapshotCommit(
+                hexsha=hexsha,
+                message=message,
+                paths=[path for path in paths.splitlines() if path],
+            )
+        )
+    return pending_commits
@@ -1,7 +1,12 @@
+from collections.abc import Iterable, Iterator
+from itertools import chain
+
 from git.repo import Repo
+from gitdb.exc import BadName, BadObject  # type: ignore[import-untyped]
 from semantic_version import Version  # type: ignore[import-untyped]
 
 from aserehe._commit import ConventionalCommit
+from aserehe._snapshot import TagSnapshot, read_pending_commits
 
 _INITIAL_VERSION = Version("0.0.0")
 
@@ -19,26 +24,93 @@ def _parse_tag_name(tag_name: str, tag_prefix: str) -> Version:
         ) from exc
 
 
-def get_current_version(repo: Repo, tag_prefix: str) -> Version:
+def create_snapshot(repo: Repo, tag_prefix: str) -> TagSnapshot:
+    """Create a snapshot of the version tags that are ancestors of HEAD and of
+    the commits since the highest of them.
+    """
+    try:
+        head = repo.head.commit
+    except ValueError as e:
+        raise ValueError(
+            "Cannot create a snapshot of a repository without commits."
+        ) from e
+    tags: dict[str, str] = {}
+    versions: dict[Version, str] = {}
+    for tag in repo.tags:
+        try:
+            tag_version = _parse_tag_name(tag.name, tag_prefix)
+        except ValueError:
+            continue
+        if repo.is_ancestor(tag.commit, head):
+            tags[tag.name] = tag.commit.hexsha
+            versions[tag_version] = tag.commit.hexsha
+
+    rev_range = head.hexsha
+    if versions:
+        rev_range = f"{versions[max(versions)]}..{rev_range}"
+    return TagSnapshot(
+        head=head.hexsha,
+        tag_prefix=tag_prefix,
+        tags=tags,
+        pending_commits=read_pending_commits(repo, rev_range),
+    )
+
+
+def load_snapshot(repo: Repo, data: str, tag_prefix: str) -> TagSnapshot:
+    """Load a snapshot created by create_snapshot and check that it was created
+    with the same tag prefix and that its head is in the local history of HEAD,
+    so that it can be used for version inference.
+    """
+    snapshot = TagSnapshot.from_json(data)
+    if snapshot.tag_prefix != tag_prefix:
+        raise ValueError(
+            f"Snapshot was created with tag prefix '{snapshot.tag_prefix}',"
+            f" expected '{tag_prefix}'."
+        )
+    try:
+        head = repo.commit(snapshot.head)
+    except (BadName, BadObject, ValueError):
+        head = None
+    if head is None or not repo.is_ancestor(head, repo.head.commit):
+        raise ValueError(
+            f"Snapshot head {snapshot.head} is not in the local history of HEAD."
+            " Fetch more history or export a snapshot from an ancestor of HEAD."
+        )
+    return snapshot
+
+
+def get_current_version(
+    repo: Repo, tag_prefix: str, snapshot: TagSnapshot | None = None
+) -> Version:
     """Return the highest semantic version tag that is an ancestor of HEAD.
 
     Note that the highest semantic version tag may not be the latest tag.
+
+    If a snapshot (see load_snapshot) is given, its tags are considered
+    in addition to the local ones.
     """
-    parent_tags = filter(
-        lambda tag: repo.is_ancestor(tag.commit, repo.head.commit), repo.tags
-    )
+    parent_tag_names = [
+        tag.name for tag in repo.tags if repo.is_ancestor(tag.commit, repo.head.commit)
+    ]
+    if snapshot is not None:
+        parent_tag_names.extend(snapshot.tags)
 
     versions: list[Version] = []
-    for tag in parent_tags:
+    for tag_name in parent_tag_names:
         try:
-            versions.append(_parse_tag_name(tag.name, tag_prefix))
+            versions.append(_parse_tag_name(tag_name, tag_prefix))
         except ValueError:
             pass
 
     return max(versions, default=_INITIAL_VERSION)
 
 
-def get_next_version(repo: Repo, tag_prefix: str, path: str | None = None) -> Version:
+def get_next_version(
+    repo: Repo,
+    tag_prefix: str,
+    path: str | None = None,
+    snapshot: TagSnapshot | None = None,
+) -> Version:
     """Infer the next semantic version from conventional commit messages since
     the current version.
 
@@ -53,26 +125,79 @@ def get_next_version(repo: Repo, tag_prefix: str, path: str | None = None) -> Ve
 
     If there are no commits since the current version, or no version-impacting changes,
     returns the current version.
+
+    If a snapshot (see load_snapshot) is given and the current version tag is not
+    an ancestor of HEAD in the local history,
+    only the local commits since the snapshot head are walked and the snapshot's
+    pending commits are considered instead of the rest of the history.
+    """
+    current_version, conv_commits = _iter_commits_since_current_version(
+        repo, tag_prefix, path, snapshot
+    )
+    return _bump_version(current_version, conv_commits)
+
+
+def get_next_version_with_commits(
+    repo: Repo,
+    tag_prefix: str,
+    path: str | None = None,
+    snapshot: TagSnapshot | None = None,
+) -> tuple[Version, list[ConventionalCommit]]:
+    """Same as get_next_version but also return the conventional commits since
+    the current version (newest first), e.g. for generating release notes.
     """
-    current_version = get_current_version(repo, tag_prefix)
+    current_version, conv_commits = _iter_commits_since_current_version(
+        repo, tag_prefix, path, snapshot
+    )
+    commits = list(conv_commits)
+    return _bump_version(current_version, commits), commits
+
+
+def _iter_commits_since_current_version(
+    repo: Repo,
+    tag_prefix: str,
+    path: str | None,
+    snapshot: TagSnapshot | None,
+) -> tuple[Version, Iterator[ConventionalCommit]]:
+    current_version = get_current_version(repo, tag_prefix, snapshot)
 
     try:
         repo.head.commit
     except ValueError:
         # no commits yet
-        return current_version
+        return current_version, iter(())
 
     rev_range = "..HEAD"
+    pending_messages: list[str] = []
 
-    current_version_tag_reference = repo.tag(f"v{current_version}")
-    if current_version_tag_reference in repo.tags:
+    current_version_tag_reference = repo.tag(f"{tag_prefix}{current_version}")
+    if current_version_tag_reference in repo.tags and (
+        snapshot is None
+        or repo.is_ancestor(current_version_tag_reference.commit, repo.head.commit)
+    ):
         rev_range = current_version_tag_reference.commit.hexsha + rev_range
+    elif snapshot is not None:
+        rev_range = snapshot.head + rev_range
+        pending_messages = [
+            commit.message for commit in snapshot.pending_commits_modifying(path)
+        ]
+
+    conv_commits = chain(
+        (
+            ConventionalCommit.from_git_commit(commit)
+            for commit in repo.iter_commits(rev=rev_range, paths=path or "")
+        ),
+        (ConventionalCommit.from_message(message) for message in pending_messages),
+    )
+    return current_version, conv_commits
+
 
+def _bump_version(
+    current_version: Version, conv_commits: Iterable[ConventionalCommit]
+) -> Version:
     bump_patch = False
     bump_minor = False
-    for commit in repo.iter_commits(rev=rev_range, paths=path or ""):
-        conv_commit = ConventionalCommit.from_git_commit(commit)
-
+    for conv_commit in conv_commits:
         # Special handling for 0.x.x versions
         if current_version.major == 0:
             if conv_commit.breaking:
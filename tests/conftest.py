@@ -2,6 +2,7 @@ from pathlib import Path
 
 import pytest
 import yaml
+from git import Repo
 
 from aserehe._commit import ConventionalCommit
 
@@ -12,12 +13,31 @@ def load_yaml_data(filename: str) -> list:
         return yaml.safe_load(f)
 
 
+@pytest.fixture
+def temp_git_repo(tmp_path) -> Repo:
+    """Create a temporary git repository for testing."""
+    repo_path = tmp_path / "test_repo"
+    repo_path.mkdir()
+    repo = Repo.init(repo_path)
+    config_writer = repo.config_writer()
+    config_writer.set_value("user", "name", "test")
+    config_writer.set_value("user", "email", "test@example.com")
+    config_writer.release()
+
+    return repo
+
+
 @pytest.fixture(params=load_yaml_data("valid_messages.yaml"))
 def valid_message(request):
     data = request.param
     return {
         "message": data["message"],
-        "expected": ConventionalCommit(type=data["type"], breaking=data["breaking"]),
+        "expected": ConventionalCommit(
+            type=data["type"],
+            breaking=data["breaking"],
+            scope=data.get("scope"),
+            description=data["description"],
+        ),
     }
 
 
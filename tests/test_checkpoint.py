@@ -0,0 +1,77 @@
+import pytest
+from git import Repo
+
+from aserehe._checkpoint import (
+    get_unchecked_rev_range,
+    prune_checkpoints,
+    update_checkpoint,
+)
+
+
+@pytest.fixture
+def repo_with_commit(temp_git_repo: Repo) -> Repo:
+    """Create a temporary git repository with a single valid commit."""
+    temp_git_repo.index.commit("feat: add feature")
+    return temp_git_repo
+
+
+def test_no_checkpoint(repo_with_commit: Repo):
+    assert get_unchecked_rev_range(repo_with_commit) is None
+
+
+def test_checkpoint_ancestor(repo_with_commit: Repo):
+    checked_commit = repo_with_commit.head.commit
+    update_checkpoint(repo_with_commit)
+    repo_with_commit.index.commit("fix: fix bug")
+    assert get_unchecked_rev_range(repo_with_commit) == f"{checked_commit.hexsha}..HEAD"
+
+
+def test_checkpoint_not_ancestor(repo_with_commit: Repo):
+    repo_with_commit.index.commit("fix: fix bug")
+    update_checkpoint(repo_with_commit)
+
+    # Simulate a force-push rewriting the checked commit
+    repo_with_commit.head.reset("HEAD~1", index=True, working_tree=True)
+    repo_with_commit.index.commit("fix: fix bug differently")
+    assert get_unchecked_rev_range(repo_with_commit) is None
+
+
+def test_checkpoint_per_branch(repo_with_commit: Repo):
+    update_checkpoint(repo_with_commit)
+    repo_with_commit.create_head("other").checkout()
+    assert get_unchecked_rev_range(repo_with_commit) is None
+
+
+def test_detached_head(repo_with_commit: Repo):
+    repo_with_commit.head.set_reference(repo_with_commit.head.commit)
+    with pytest.raises(ValueError, match="detached HEAD"):
+        get_unchecked_rev_range(repo_with_commit)
+
+
+def test_prune_checkpoints(repo_with_commit: Repo):
+    update_checkpoint(repo_with_commit)
+    main_branch = repo_with_commit.active_branch
+    feature_branch = repo_with_commit.create_head("feature")
+    feature_branch.checkout()
+    update_checkpoint(repo_with_commit)
+    main_branch.checkout()
+    repo_with_commit.delete_head(feature_branch)
+
+    assert prune_checkpoints(repo_with_commit) == ["refs/aserehe/checked/feature"]
+    assert prune_checkpoints(repo_with_commit) == []
+    assert get_unchecked_rev_range(repo_with_commit) is not None
+
+
+def test_checkpoint_of_deleted_parent_branch(repo_with_commit: Repo):
+    main_branch = repo_with_commit.active_branch
+    feature_branch = repo_with_commit.create_head("feature")
+    feature_branch.checkout()
+    update_checkpoint(repo_with_commit)
+    main_branch.checkout()
+    repo_with_commit.delete_head(feature_branch)
+
+    repo_with_commit.create_head("feature/x").checkout()
+    update_checkpoint(repo_with_commit)
+    assert get_unchecked_rev_range(repo_with_commit) == (
+        f"{repo_with_commit.head.commit.hexsha}..HEAD"
+    )
@@ -59,6 +59,36 @@ def test_check_commits(tmp_path, monkeypatch):
     ), f"Expected exit code 0 but got {result.exit_code}. Output: {result.output}"
 
 
+def test_check_incremental(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    repo = Repo.init()
+    repo.index.commit("feat: add feature")
+
+    result = runner.invoke(app, ["check", "--incremental"])
+    assert result.exit_code == 0
+    checked_commit = repo.head.commit
+    checkpoint_ref = f"refs/aserehe/checked/{repo.active_branch.name}"
+
+    # Invalid commit should fail and keep the checkpoint
+    repo.index.commit("invalid commit message")
+    result = runner.invoke(app, ["check", "--incremental"])
+    assert result.exit_code == 1
+    assert repo.commit(checkpoint_ref) == checked_commit
+
+    # Rewriting history falls back to checking all commits
+    repo.head.reset("HEAD~1", index=True, working_tree=True)
+    repo.index.commit("fix: fix bug")
+    result = runner.invoke(app, ["check", "--incremental"])
+    assert result.exit_code == 0
+    assert repo.commit(checkpoint_ref) == repo.head.commit
+
+    result = runner.invoke(
+        app, ["check", "--incremental", "--rev-range", "HEAD~..HEAD"]
+    )
+    assert result.exit_code == 1
+    assert "Cannot use --rev-range with --incremental" in result.output
+
+
 def test_version(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     repo = Repo.init()
@@ -100,6 +130,28 @@ def test_version(tmp_path, monkeypatch):
     assert next_version_cmd() == "1.1.0"
 
 
+def test_version_with_notes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    repo = Repo.init()
+    repo.index.commit("chore: initial commit")
+    repo.create_tag("v1.0.0")
+    repo.index.commit("feat(api): add endpoint")
+    repo.index.commit("fix: fix bug")
+
+    result = runner.invoke(app, ["version", "--next", "--notes", "markdown"])
+    assert result.exit_code == 0
+    assert result.output.startswith("## 1.1.0\n")
+    assert "- **api:** add endpoint" in result.output
+
+    result = runner.invoke(app, ["version", "--next", "--notes", "json"])
+    assert result.exit_code == 0
+    assert '"version": "1.1.0"' in result.output
+
+    result = runner.invoke(app, ["version", "--notes", "json"])
+    assert result.exit_code == 1
+    assert "Cannot use --notes without --next" in result.output
+
+
 def test_version_with_path(tmp_path, monkeypatch):
     """Test that the --path option filters commits affecting only the specified path."""
     monkeypatch.chdir(tmp_path)
@@ -148,3 +200,62 @@ def test_version_with_path(tmp_path, monkeypatch):
     assert (
         out_none == "1.0.0"
     ), f"Expected 1.0.0 when no commits match the path, got {out_none}"
+
+
+def test_version_with_snapshot(tmp_path, monkeypatch):
+    full_repo = Repo.init(tmp_path / "full")
+
+    # Snapshot of a repository without commits should fail
+    monkeypatch.chdir(full_repo.working_dir)
+    result = runner.invoke(app, ["snapshot"])
+    assert result.exit_code == 1
+    assert "without commits" in result.output
+
+    full_repo.index.commit("chore: initial commit")
+    full_repo.create_tag("v1.0.0")
+    full_repo.index.commit("feat: add feature")
+
+    monkeypatch.chdir(full_repo.working_dir)
+    result = runner.invoke(app, ["snapshot"])
+    assert result.exit_code == 0
+    snapshot_file = tmp_path / "snapshot.json"
+    snapshot_file.write_text(result.output)
+
+    shallow_repo = Repo.clone_from(
+        f"file://{full_repo.working_dir}", tmp_path / "shallow", depth=1
+    )
+    monkeypatch.chdir(shallow_repo.working_dir)
+    snapshot_args = ["--snapshot", str(snapshot_file)]
+    result = runner.invoke(app, ["version", *snapshot_args])
+    assert result.exit_code == 0
+    assert result.output.strip() == "1.0.0"
+    result = runner.invoke(app, ["version", "--next", *snapshot_args])
+    assert result.exit_code == 0
+    assert result.output.strip() == "1.1.0"
+
+    # Glob and magic pathspecs are not supported with a snapshot
+    result = runner.invoke(
+        app, ["version", "--next", "--path", "*.txt", *snapshot_args]
+    )
+    assert result.exit_code == 1
+    assert "Only plain file or directory paths" in result.output
+
+    # Snapshot created with a different tag prefix should fail
+    result = runner.invoke(app, ["version", "--tag-prefix", "pkg/", *snapshot_args])
+    assert result.exit_code == 1
+    assert "created with tag prefix 'v'" in result.output
+
+    # Malformed snapshot should fail with an error message
+    invalid_snapshot_file = tmp_path / "invalid.json"
+    invalid_snapshot_file.write_text("{}")
+    result = runner.invoke(app, ["version", "--snapshot", str(invalid_snapshot_file)])
+    assert result.exit_code == 1
+    assert "Invalid tag snapshot" in result.output
+
+    # Snapshot head must be in the local history
+    full_repo.index.commit("fix: fix bug")
+    shallow_repo.remotes.origin.fetch(depth=1)
+    shallow_repo.head.reset("origin/HEAD", index=True, working_tree=True)
+    result = runner.invoke(app, ["version", "--next", *snapshot_args])
+    assert result.exit_code == 1
+    assert "not in the local history" in result.output
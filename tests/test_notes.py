@@ -0,0 +1,57 @@
+import json
+
+from semantic_version import Version
+
+from aserehe._commit import ConventionalCommit
+from aserehe._notes import _SECTION_TITLES, NotesFormat, format_notes
+
+COMMITS = [
+    ConventionalCommit.from_message("fix(cli): do not crash on empty input"),
+    ConventionalCommit.from_message("feat!: drop support for Python 2"),
+    ConventionalCommit.from_message("feat: add API endpoint"),
+    ConventionalCommit.from_message("docs: update readme"),
+]
+
+
+def test_markdown():
+    assert format_notes(Version("2.0.0"), COMMITS, NotesFormat.MARKDOWN) == "\n".join(
+        [
+            "## 2.0.0",
+            "",
+            "### Breaking Changes",
+            "",
+            "- drop support for Python 2",
+            "",
+            "### Features",
+            "",
+            "- add API endpoint",
+            "",
+            "### Bug Fixes",
+            "",
+            "- **cli:** do not crash on empty input",
+            "",
+            "### Documentation",
+            "",
+            "- update readme",
+        ]
+    )
+
+
+def test_section_titles_cover_commit_types():
+    assert set(_SECTION_TITLES) == ConventionalCommit._TYPES
+
+
+def test_markdown_no_commits():
+    assert format_notes(Version("1.0.0"), [], NotesFormat.MARKDOWN) == "## 1.0.0"
+
+
+def test_json():
+    notes = json.loads(format_notes(Version("2.0.0"), COMMITS, NotesFormat.JSON))
+    assert notes["version"] == "2.0.0"
+    assert notes["commits"][0] == {
+        "type": "fix",
+        "breaking": False,
+        "scope": "cli",
+        "description": "do not crash on empty input",
+    }
+    assert len(notes["commits"]) == len(COMMITS)
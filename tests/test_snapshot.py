@@ -0,0 +1,162 @@
+from pathlib import Path
+
+import pytest
+from git import Repo
+from semantic_version import Version
+
+from aserehe._snapshot import SnapshotCommit, TagSnapshot, check_snapshot_path
+from aserehe._version import (
+    create_snapshot,
+    get_current_version,
+    get_next_version,
+    load_snapshot,
+)
+
+
+@pytest.fixture
+def full_repo(temp_git_repo: Repo) -> Repo:
+    """Create a repository with a tagged commit followed by two commits."""
+    temp_git_repo.index.commit("chore: initial commit")
+    temp_git_repo.create_tag("v1.0.0")
+    for name, message in [("a.txt", "fix: fix bug in a"), ("b.txt", "feat: add b")]:
+        (Path(temp_git_repo.working_dir) / name).write_text("content")
+        temp_git_repo.index.add([name])
+        temp_git_repo.index.commit(message)
+    return temp_git_repo
+
+
+def _shallow_clone(repo: Repo, path, depth: int) -> Repo:
+    return Repo.clone_from(f"file://{repo.working_dir}", path, depth=depth)
+
+
+class TestSnapshotCommit:
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            (None, True),
+            (".", True),
+            ("src", True),
+            ("src/", True),
+            ("src/a.txt", True),
+            ("sr", False),
+            ("src/b.txt", False),
+        ],
+    )
+    def test_modifies(self, path: str | None, expected: bool):
+        commit = SnapshotCommit(hexsha="0" * 40, message="fix: x", paths=["src/a.txt"])
+        assert commit.modifies(path) == expected
+
+
+@pytest.mark.parametrize("path", ["*.txt", "src/[ab].txt", ":(exclude)src"])
+def test_unsupported_path(path: str):
+    with pytest.raises(ValueError, match="Only plain file or directory paths"):
+        check_snapshot_path(path)
+
+
+class TestTagSnapshot:
+    def test_create_snapshot(self, full_repo: Repo):
+        snapshot = create_snapshot(full_repo, tag_prefix="v")
+        assert snapshot.head == full_repo.head.commit.hexsha
+        assert snapshot.tags == {"v1.0.0": full_repo.commit("v1.0.0").hexsha}
+        assert [c.message.strip() for c in snapshot.pending_commits] == [
+            "feat: add b",
+            "fix: fix bug in a",
+        ]
+        assert [c.paths for c in snapshot.pending_commits] == [["b.txt"], ["a.txt"]]
+
+    def test_json_roundtrip(self, full_repo: Repo):
+        snapshot = create_snapshot(full_repo, tag_prefix="v")
+        assert TagSnapshot.from_json(snapshot.to_json()) == snapshot
+
+    @pytest.mark.parametrize("data", ["", "[]", "{}", '{"head": "abc", "tags": {}}'])
+    def test_invalid_json(self, data: str):
+        with pytest.raises(ValueError, match="Invalid tag snapshot"):
+            TagSnapshot.from_json(data)
+
+    def test_shallow_clone(self, full_repo: Repo, tmp_path):
+        snapshot_data = create_snapshot(full_repo, tag_prefix="v").to_json()
+        full_repo.index.commit("fix: fix another bug")
+        shallow_repo = _shallow_clone(full_repo, tmp_path / "shallow", depth=2)
+        snapshot = load_snapshot(shallow_repo, snapshot_data, "v")
+
+        assert get_current_version(shallow_repo, "v") == Version("0.0.0")
+        assert get_current_version(shallow_repo, "v", snapshot) == Version("1.0.0")
+        assert get_next_version(shallow_repo, "v", snapshot=snapshot) == Version(
+            "1.1.0"
+        )
+        assert get_next_version(
+            shallow_repo, "v", path="a.txt", snapshot=snapshot
+        ) == Version("1.0.1")
+
+    def test_merge_commit_with_path(self, full_repo: Repo, tmp_path):
+        """Merge commits are skipped with a path, as in git log -- <path>."""
+        repo_dir = Path(full_repo.working_dir)
+        main_branch = full_repo.active_branch
+        full_repo.create_head("side").checkout()
+        (repo_dir / "pkg").mkdir()
+        (repo_dir / "pkg" / "a.txt").write_text("content")
+        full_repo.index.add(["pkg/a.txt"])
+        full_repo.index.commit("feat: side pkg")
+        main_branch.checkout()
+        full_repo.git.merge("side", "--no-ff", "-m", "Merge branch side")
+
+        assert get_next_version(full_repo, "v", path="pkg") == Version("1.1.0")
+        snapshot_data = create_snapshot(full_repo, tag_prefix="v").to_json()
+        full_repo.index.commit("chore: unrelated change")
+        shallow_repo = _shallow_clone(full_repo, tmp_path / "shallow", depth=2)
+        snapshot = load_snapshot(shallow_repo, snapshot_data, "v")
+        assert get_next_version(
+            shallow_repo, "v", path="pkg", snapshot=snapshot
+        ) == Version("1.1.0")
+
+    def test_rename_out_of_path(self, full_repo: Repo, tmp_path):
+        """Renames count for both paths, as in git log -- <path>."""
+        repo_dir = Path(full_repo.working_dir)
+        (repo_dir / "pkg").mkdir()
+        (repo_dir / "pkg" / "x.txt").write_text("content")
+        full_repo.git.add("pkg/x.txt")
+        full_repo.git.commit("-m", "chore: add pkg file")
+        (repo_dir / "other").mkdir()
+        full_repo.git.mv("pkg/x.txt", "other/x.txt")
+        full_repo.git.commit("-m", "feat: move x out of pkg")
+
+        assert get_next_version(full_repo, "v", path="pkg") == Version("1.1.0")
+        snapshot_data = create_snapshot(full_repo, tag_prefix="v").to_json()
+        full_repo.index.commit("chore: unrelated change")
+        shallow_repo = _shallow_clone(full_repo, tmp_path / "shallow", depth=2)
+        snapshot = load_snapshot(shallow_repo, snapshot_data, "v")
+        assert get_next_version(
+            shallow_repo, "v", path="pkg", snapshot=snapshot
+        ) == Version("1.1.0")
+
+    def test_newer_local_tag(self, temp_git_repo: Repo, tmp_path):
+        temp_git_repo.index.commit("chore: initial commit")
+        temp_git_repo.create_tag("pkg/1.0.0")
+        temp_git_repo.index.commit("feat: add feature")
+        snapshot_data = create_snapshot(temp_git_repo, tag_prefix="pkg/").to_json()
+        temp_git_repo.create_tag("pkg/1.1.0")
+        temp_git_repo.index.commit("fix: fix bug")
+        shallow_repo = _shallow_clone(temp_git_repo, tmp_path / "shallow", depth=2)
+        snapshot = load_snapshot(shallow_repo, snapshot_data, "pkg/")
+
+        assert get_current_version(shallow_repo, "pkg/", snapshot) == Version("1.1.0")
+        assert get_next_version(shallow_repo, "pkg/", snapshot=snapshot) == Version(
+            "1.1.1"
+        )
+
+    def test_tag_prefix_mismatch(self, full_repo: Repo):
+        snapshot_data = create_snapshot(full_repo, tag_prefix="pkg-a/").to_json()
+        with pytest.raises(ValueError, match="created with tag prefix 'pkg-a/'"):
+            load_snapshot(full_repo, snapshot_data, "v")
+
+    def test_no_commits(self, temp_git_repo: Repo):
+        with pytest.raises(ValueError, match="without commits"):
+            create_snapshot(temp_git_repo, tag_prefix="v")
+
+    def test_head_not_in_history(self, full_repo: Repo, tmp_path):
+        snapshot_data = create_snapshot(full_repo, tag_prefix="v").to_json()
+        full_repo.index.commit("fix: fix another bug")
+        shallow_repo = _shallow_clone(full_repo, tmp_path / "shallow", depth=1)
+
+        with pytest.raises(ValueError, match="not in the local history"):
+            load_snapshot(shallow_repo, snapshot_data, "v")
@@ -8,23 +8,10 @@ from aserehe._version import (
     _parse_tag_name,
     get_current_version,
     get_next_version,
+    get_next_version_with_commits,
 )
 
 
-@pytest.fixture
-def temp_git_repo(tmp_path) -> Repo:
-    """Create a temporary git repository for testing."""
-    repo_path = tmp_path / "test_repo"
-    repo_path.mkdir()
-    repo = Repo.init(repo_path)
-    config_writer = repo.config_writer()
-    config_writer.set_value("user", "name", "test")
-    config_writer.set_value("user", "email", "test@example.com")
-    config_writer.release()
-
-    return repo
-
-
 class TestParseTagName:
     @pytest.mark.parametrize(
         "tag_prefix, tag_name, expected_version",
@@ -175,3 +162,30 @@ class TestGetNextVersion:
         temp_git_repo.create_tag("v0.2.1")
         temp_git_repo.index.commit("fix: bug fix")
         assert get_next_version(repo=temp_git_repo, tag_prefix="v") == Version("0.2.2")
+
+
+class TestGetNextVersionWithCommits:
+    def test_no_commits(self, temp_git_repo: Repo, monkeypatch: MonkeyPatch):
+        monkeypatch.chdir(temp_git_repo.working_dir)
+        assert get_next_version_with_commits(repo=temp_git_repo, tag_prefix="v") == (
+            _INITIAL_VERSION,
+            [],
+        )
+
+    def test_commits_since_current_version(
+        self, temp_git_repo: Repo, monkeypatch: MonkeyPatch
+    ):
+        monkeypatch.chdir(temp_git_repo.working_dir)
+        temp_git_repo.index.commit("initial commit")
+        temp_git_repo.create_tag("v1.0.0")
+        temp_git_repo.index.commit("feat(api)!: breaking change")
+        temp_git_repo.index.commit("fix: fix bug")
+
+        next_version, commits = get_next_version_with_commits(
+            repo=temp_git_repo, tag_prefix="v"
+        )
+        assert next_version == Version("2.0.0")
+        assert [(c.type, c.scope, c.description, c.breaking) for c in commits] == [
+            ("fix", None, "fix bug", False),
+            ("feat", "api", "breaking change", True),
+        ]